@@ -12,22 +12,139 @@ Prerequisites
 - Install deps: pip install slack_sdk pyyaml
 - Env var SLACK_BOT_TOKEN must be set (bot token with channels:history, chat:write, conversations:read, users:read scopes).
 - Optional env var CONFIG_PATH to point to a YAML config; defaults to config.yaml.
+- For --mode socket, env var SLACK_APP_TOKEN must hold an app-level token (connections:write) and the
+  app must subscribe to message.channels / message.groups events.
 """
 from __future__ import annotations
 
 import argparse
+import atexit
+import collections
+import csv
 import dataclasses
 import logging
+import math
 import os
+import random
+import re
+import signal
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time as dtime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from zoneinfo import ZoneInfo
 
 import yaml
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.socket_mode import SocketModeClient
+from slack_sdk.socket_mode.request import SocketModeRequest
+from slack_sdk.socket_mode.response import SocketModeResponse
+
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+CHANNELS_CACHE_TTL_SECONDS = 300
+CHANNELS_CACHE_MAX_TTL_SECONDS = 3600
+CHANNELS_CACHE_BETA = 1.0
+CHANNEL_ID_PATTERN = re.compile(r"[CG][A-Z0-9]{8,}")
+NEWLINES_TO_SPACES = str.maketrans("\r\n", "  ")
+HISTORY_FETCH_WORKERS = 8
+EVENT_SCAN_SECONDS = 60
+HISTORY_PAGE_SIZE = 15
+HISTORY_MAX_PAGES = 5
+DEFAULT_CALLS_PER_MINUTE = 20
+METHOD_CALLS_PER_MINUTE = {
+    "users_conversations": 50,
+    "conversations_history": 50,
+    "conversations_info": 50,
+    "conversations_open": 50,
+    "chat_postMessage": 50,
+}
+RATE_LIMIT_MAX_RETRIES = 3
+
+
+class RateLimiter:
+    """Sliding-window limiter allowing at most ``max_calls`` per ``period`` seconds."""
+
+    def __init__(self, max_calls: int, period: float = 60.0) -> None:
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: Deque[float] = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(wait)
+
+
+class RateLimitedClient:
+    """Wraps a WebClient with per-method rate limits and Retry-After handling on 429s."""
+
+    def __init__(
+        self,
+        client: WebClient,
+        limits: Optional[Dict[str, int]] = None,
+        max_retries: int = RATE_LIMIT_MAX_RETRIES,
+    ) -> None:
+        self._client = client
+        self._limits = dict(METHOD_CALLS_PER_MINUTE if limits is None else limits)
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        self.max_retries = max_retries
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        limiter = self._limiter(name)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._call_with_retry(name, attr, limiter, *args, **kwargs)
+
+        return call
+
+    def _limiter(self, method: str) -> RateLimiter:
+        with self._limiters_lock:
+            limiter = self._limiters.get(method)
+            if limiter is None:
+                limiter = RateLimiter(self._limits.get(method, DEFAULT_CALLS_PER_MINUTE))
+                self._limiters[method] = limiter
+            return limiter
+
+    def _call_with_retry(
+        self, method: str, func: Callable[..., Any], limiter: RateLimiter, *args: Any, **kwargs: Any
+    ) -> Any:
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                return func(*args, **kwargs)
+            except SlackApiError as exc:
+                if exc.response.status_code != 429 or attempt >= self.max_retries:
+                    raise
+                headers = exc.response.headers or {}
+                retry_after = float(headers.get("Retry-After") or headers.get("retry-after") or 1)
+                delay = max(retry_after, 2**attempt)
+                attempt += 1
+                logging.warning(
+                    "Rate limited on %s; retrying in %ss (attempt %s/%s)",
+                    method,
+                    delay,
+                    attempt,
+                    self.max_retries,
+                )
+                time.sleep(delay)
 
 
 @dataclasses.dataclass
@@ -36,19 +153,28 @@ class BusinessHours:
     end: dtime = dtime.fromisoformat("17:00")
     timezone: str = "UTC"
     weekdays_only: bool = True
+    tz: ZoneInfo = dataclasses.field(init=False, repr=False, compare=False)
+    _start_sec: int = dataclasses.field(init=False, repr=False, compare=False)
+    _end_sec: int = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.tz = ZoneInfo(self.timezone)
+        self._start_sec = self.start.hour * 3600 + self.start.minute * 60 + self.start.second
+        self._end_sec = self.end.hour * 3600 + self.end.minute * 60 + self.end.second
 
     def is_open(self, moment: datetime) -> bool:
-        local_now = moment.astimezone(ZoneInfo(self.timezone))
+        local_now = moment.astimezone(self.tz)
         if self.weekdays_only and local_now.weekday() >= 5:
             return False
-        return self.start <= local_now.time() <= self.end
+        now_sec = local_now.hour * 3600 + local_now.minute * 60 + local_now.second
+        return self._start_sec <= now_sec <= self._end_sec
 
 
 @dataclasses.dataclass
 class MonitorConfig:
     channel_owners: Dict[str, str]
-    team_member_ids: List[str]
-    business_hours: BusinessHours = BusinessHours()
+    team_member_ids: FrozenSet[str]
+    business_hours: BusinessHours = dataclasses.field(default_factory=BusinessHours)
     business_reply_hours: int = 4
     overall_reply_hours: int = 24
     check_interval_minutes: int = 10
@@ -58,6 +184,10 @@ class MonitorConfig:
         "Reminder: Client message in <#{}> has been waiting {} hours for a reply. "
         "Please respond."
     )
+    resolved_owners: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.team_member_ids = frozenset(self.team_member_ids)
 
     @classmethod
     def from_yaml(cls, path: Path) -> "MonitorConfig":
@@ -86,10 +216,53 @@ class MonitorConfig:
 
 
 class SlackMonitor:
-    def __init__(self, config: MonitorConfig, client: WebClient) -> None:
+    def __init__(
+        self,
+        config: MonitorConfig,
+        client: Union[WebClient, RateLimitedClient],
+        discover: bool = False,
+        event_driven: bool = False,
+    ) -> None:
         self.config = config
         self.client = client
+        self.discover = discover
+        self.event_driven = event_driven
+        self._channel_names: Dict[str, str] = {}
+        self._dm_channel_by_user: Dict[str, str] = {}
+        self._last_full_check_ts: Optional[float] = None
+        self._unanswered_client_ts: Dict[str, float] = {}
+        self._newest_ts: Dict[str, str] = {}
+        self._channel_records: Dict[str, dict] = {}
+        self._records_lock = threading.Lock()
+        self._last_synced: Dict[str, float] = {}
+        self._pending_events: Dict[str, List[dict]] = collections.defaultdict(list)
+        self._last_reported: Dict[str, Tuple[tuple, float]] = {}
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._pool = ThreadPoolExecutor(
+            max_workers=HISTORY_FETCH_WORKERS, thread_name_prefix="history"
+        )
+        # (channels, expiry, delta) where delta is how long the last listing took.
+        self._channels_cache: Optional[Tuple[List[dict], float, float]] = None
+        self._channels_ttl_s = CHANNELS_CACHE_TTL_SECONDS
+        self._channels_lock = threading.Lock()
+        self._channels_refreshing = False
+        self._owners_by_id: Dict[str, str] = {}
+        self._owners_by_name: Dict[str, str] = {}
+        self._names_resolved = False
+        self._unmatched_names: Set[str] = set()
         self._ensure_log_header()
+        self._log_fp = self.config.log_path.open("a", encoding="utf-8", buffering=1)
+        self._trail_fp = self.config.trail_log_path.open("a", encoding="utf-8", buffering=1)
+        self._log_writer = csv.writer(self._log_fp, lineterminator="\n")
+        self._trail_writer = csv.writer(self._trail_fp, lineterminator="\n")
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        for fp in (self._log_fp, self._trail_fp):
+            if not fp.closed:
+                fp.close()
 
     def _ensure_log_header(self) -> None:
         self._ensure_file(
@@ -108,32 +281,143 @@ class SlackMonitor:
             path.write_text(header, encoding="utf-8")
 
     def run_forever(self) -> None:
-        interval = max(self.config.check_interval_minutes, 1) * 60
-        while True:
+        interval = (
+            EVENT_SCAN_SECONDS
+            if self.event_driven
+            else max(self.config.check_interval_minutes, 1) * 60
+        )
+        while not self._stop.is_set():
             try:
                 self.check_channels()
             except Exception as exc:  # noqa: BLE001
                 logging.exception("Monitor iteration failed: %s", exc)
-            time.sleep(interval)
+            self._wake.wait(interval)
+            self._wake.clear()
+        self.close()
+        logging.info("Monitor stopped")
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self) -> None:
+        self._wake.set()
+
+    def handle_message_event(self, event: dict) -> None:
+        channel_id = event.get("channel")
+        if not channel_id or not (self.discover or channel_id in self.config.resolved_owners):
+            return
+        thread_ts = event.get("thread_ts")
+        if thread_ts and thread_ts != event.get("ts") and event.get("subtype") != "thread_broadcast":
+            return
+        with self._records_lock:
+            if channel_id not in self._last_synced:
+                # Not seeded yet; applied once the first history read is merged.
+                self._pending_events[channel_id].append(event)
+                return
+            record = self._evaluate_channel([event], self._channel_records.get(channel_id))
+            if record:
+                self._channel_records[channel_id] = record
+
+    def resolve_channel_owners(self) -> None:
+        for key, owner_id in self.config.channel_owners.items():
+            if CHANNEL_ID_PATTERN.fullmatch(key):
+                self._owners_by_id[key] = owner_id
+            else:
+                self._owners_by_name[key] = owner_id
+        self.config.resolved_owners = dict(self._owners_by_id)
+        self._names_resolved = not self._owners_by_name
+        if not self._names_resolved:
+            self._fetch_monitored_channels()
+        if not self._names_resolved:
+            logging.warning(
+                "Could not list channels to resolve %s configured channel names; "
+                "retrying on the next check",
+                len(self._owners_by_name),
+            )
+        logging.info("Resolved %s configured channels", len(self.config.resolved_owners))
+
+    def _match_owner_names(self, channels: List[dict]) -> None:
+        resolved: Dict[str, str] = {}
+        unmatched = set(self._owners_by_name)
+        for channel in channels:
+            self._channel_names[channel["id"]] = channel["name"]
+            owner_id = self._owners_by_name.get(channel["name"])
+            if owner_id is None:
+                continue
+            unmatched.discard(channel["name"])
+            resolved.setdefault(channel["id"], owner_id)
+        for name in sorted(unmatched - self._unmatched_names):
+            logging.warning("Configured channel %s not found among the bot's channels", name)
+        self._unmatched_names = unmatched
+        resolved.update(self._owners_by_id)
+        self.config.resolved_owners = resolved
+        self._names_resolved = True
 
     def check_channels(self) -> None:
-        now = datetime.now(tz=ZoneInfo(self.config.business_hours.timezone))
-        channels = self._fetch_monitored_channels()
+        now = datetime.now(tz=self.config.business_hours.tz)
+        if not self.config.business_hours.is_open(now) and not self._offhours_check_due(now):
+            logging.debug("Outside business hours and no reminder can be due yet; skipping check")
+            return
+        self._last_full_check_ts = now.timestamp()
+        if not self.discover and not self._names_resolved:
+            self._fetch_monitored_channels()
+        if self.discover:
+            channels = self._fetch_monitored_channels()
+        else:
+            channels = [
+                {"id": channel_id, "name": self._channel_name(channel_id)}
+                for channel_id in self.config.resolved_owners
+            ]
+        # In event-driven mode message events keep records current; history is only
+        # re-read once per check interval to catch up on events missed while the
+        # socket was disconnected.
+        sync_interval = max(self.config.check_interval_minutes, 1) * 60
+        sync_now = time.monotonic()
+        futures = {
+            channel["id"]: self._pool.submit(
+                self._fetch_messages,
+                channel["id"],
+                channel["name"],
+                oldest=self._newest_ts.get(channel["id"]),
+            )
+            for channel in channels
+            if not self.event_driven
+            or sync_now - self._last_synced.get(channel["id"], -math.inf) >= sync_interval
+        }
         for channel in channels:
             channel_id = channel["id"]
             channel_name = channel["name"]
-            owner_id = channel.get("owner_id")
-            logging.info("Checking channel %s (%s)", channel_name, channel_id)
-            messages = self._fetch_messages(channel_id, channel_name)
-            if logging.getLogger().isEnabledFor(logging.DEBUG):
+            owner_id = self._resolve_owner(channel_id)
+            future = futures.get(channel_id)
+            messages: List[dict] = []
+            if future is not None:
+                logging.info("Checking channel %s (%s)", channel_name, channel_id)
+                messages = future.result()
                 self._debug_log_messages(channel_id, messages)
-            record = self._evaluate_channel(messages)
+            with self._records_lock:
+                record = self._evaluate_channel(messages, self._channel_records.get(channel_id))
+                if future is not None:
+                    self._last_synced[channel_id] = sync_now
+                    for event in self._pending_events.pop(channel_id, []):
+                        record = self._evaluate_channel([event], record)
+                if record:
+                    self._channel_records[channel_id] = record
+            if messages:
+                self._newest_ts[channel_id] = messages[0]["ts"]
             if not record:
-                logging.info("No client messages found for %s, %s", channel_id, channel_name)
+                self._unanswered_client_ts.pop(channel_id, None)
+                if future is not None:
+                    logging.info("No client messages found for %s, %s", channel_id, channel_name)
                 continue
             status = self._decide_status(record, now)
-            self._log_record(channel_name, channel_id, record, status)
-            self._log_trail(channel_name, channel_id, record, status)
+            if status == "answered":
+                self._unanswered_client_ts.pop(channel_id, None)
+            else:
+                self._unanswered_client_ts[channel_id] = record["client_ts"]
+            if self.event_driven and not self._report_due(channel_id, record, status):
+                continue
+            self._log(channel_name, channel_id, record, status)
             if status == "remind" and owner_id:
                 self._send_reminder(channel_id, owner_id, record, now)
             elif status == "remind" and not owner_id:
@@ -143,51 +427,159 @@ class SlackMonitor:
                     channel_id,
                 )
 
-    def _fetch_messages(self, channel_id: str, channel_name: str, limit: int = 200) -> List[dict]:
+    def _report_due(self, channel_id: str, record: dict, status: str) -> bool:
+        # Event-driven scans run every minute; only re-log and re-remind an unchanged
+        # record once per check interval, matching the polling cadence.
+        key = (record["client_ts"], record["team_reply_ts"], status)
+        now = time.monotonic()
+        last = self._last_reported.get(channel_id)
+        if last is not None and last[0] == key:
+            if now - last[1] < max(self.config.check_interval_minutes, 1) * 60:
+                return False
+        self._last_reported[channel_id] = (key, now)
+        return True
+
+    def _offhours_check_due(self, now: datetime) -> bool:
+        if self._last_full_check_ts is None:
+            return True
+        # A client message not seen yet arrived after the last full check, so the
+        # earliest overall deadline belongs to either that check or an unanswered record.
+        oldest = min(self._unanswered_client_ts.values(), default=self._last_full_check_ts)
+        return now.timestamp() >= oldest + self.config.overall_reply_hours * 3600
+
+    def _fetch_messages(
+        self,
+        channel_id: str,
+        channel_name: str,
+        limit: int = HISTORY_PAGE_SIZE,
+        oldest: Optional[str] = None,
+    ) -> List[dict]:
+        if oldest is not None and self._latest_ts(channel_id) == oldest:
+            logging.debug("No new messages in %s since %s", channel_name, oldest)
+            return []
+        messages: List[dict] = []
+        cursor: Optional[str] = None
+        for _ in range(HISTORY_MAX_PAGES):
+            try:
+                resp = self.client.conversations_history(
+                    channel=channel_id, limit=limit, cursor=cursor, oldest=oldest
+                )
+            except SlackApiError as exc:
+                logging.exception("Failed to fetch messages for %s: %s", channel_id, exc)
+                break
+            page = resp.get("messages", [])
+            messages.extend(page)
+            if any(self._is_valid_message(msg) and self._is_client_message(msg) for msg in page):
+                break
+            cursor = resp.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        logging.debug("Fetched %s messages for %s", len(messages), channel_name)
+        return messages
+
+    def _latest_ts(self, channel_id: str) -> Optional[str]:
         try:
-            resp = self.client.conversations_history(channel=channel_id, limit=limit)
-            messages = resp.get("messages", [])
-            logging.debug("Fetched %s messages for %s", len(messages), channel_name)
-            return messages
+            resp = self.client.conversations_info(channel=channel_id)
         except SlackApiError as exc:
-            logging.exception("Failed to fetch messages for %s: %s", channel_id, exc)
-            return []
+            logging.warning("Failed to fetch channel info for %s: %s", channel_id, exc)
+            return None
+        latest = resp.get("channel", {}).get("latest") or {}
+        return latest.get("ts")
 
     def _fetch_monitored_channels(self) -> List[dict]:
+        cache = self._channels_cache
+        if cache is not None:
+            cached, expiry, delta = cache
+            now = time.monotonic()
+            if now < expiry:
+                # XFetch: refresh early with a probability that rises as expiry nears.
+                if now - delta * CHANNELS_CACHE_BETA * math.log(1.0 - random.random()) >= expiry:
+                    self._refresh_channels_async()
+                logging.debug("Using cached channel list (%s channels)", len(cached))
+                return cached
+        return self._refresh_channels()
+
+    def _refresh_channels_async(self) -> None:
+        with self._channels_lock:
+            if self._channels_refreshing:
+                return
+            self._channels_refreshing = True
+
+        def refresh() -> None:
+            try:
+                self._refresh_channels()
+            except Exception as exc:  # noqa: BLE001
+                logging.exception("Background channel refresh failed: %s", exc)
+            finally:
+                self._channels_refreshing = False
+
+        self._pool.submit(refresh)
+
+    def _refresh_channels(self) -> List[dict]:
+        started = time.monotonic()
+        channels, complete = self._list_channels()
+        finished = time.monotonic()
+        with self._channels_lock:
+            if complete:
+                self._channels_cache = (channels, finished + self._channels_ttl_s, finished - started)
+                self._match_owner_names(channels)
+            elif self._channels_cache is not None:
+                cached, _, delta = self._channels_cache
+                self._channels_cache = (cached, finished + self._channels_ttl_s, delta)
+                return cached
+        logging.debug("Monitoring %s channels", len(channels))
+        return channels
+
+    def _list_channels(self) -> Tuple[List[dict], bool]:
         channels: List[dict] = []
         cursor: Optional[str] = None
         types = "public_channel,private_channel"
         while True:
             try:
-                resp = self.client.conversations_list(types=types, cursor=cursor, limit=200)
+                resp = self.client.users_conversations(
+                    types=types, cursor=cursor, limit=999, exclude_archived=True
+                )
             except SlackApiError as exc:
-                logging.exception("Failed to list channels: %s", exc)
-                break
+                if exc.response.get("error") == "ratelimited":
+                    self._channels_ttl_s = min(self._channels_ttl_s * 2, CHANNELS_CACHE_MAX_TTL_SECONDS)
+                    logging.warning(
+                        "Rate limited listing channels; channel cache TTL raised to %ss",
+                        self._channels_ttl_s,
+                    )
+                else:
+                    logging.exception("Failed to list channels: %s", exc)
+                return channels, False
 
             for channel in resp.get("channels", []):
-                if not channel.get("is_member"):
-                    continue
-                owner_id = self._resolve_owner(channel)
                 channel_name = channel.get("name") or channel.get("name_normalized") or channel.get("id")
-                channels.append({"id": channel["id"], "name": channel_name, "owner_id": owner_id})
+                channels.append({"id": channel["id"], "name": channel_name})
 
             cursor = resp.get("response_metadata", {}).get("next_cursor")
             if not cursor:
-                break
+                return channels, True
 
-        logging.debug("Monitoring %s channels", len(channels))
-        return channels
+    def _channel_name(self, channel_id: str) -> str:
+        name = self._channel_names.get(channel_id)
+        if name is not None:
+            return name
+        try:
+            resp = self.client.conversations_info(channel=channel_id)
+        except SlackApiError as exc:
+            logging.warning("Failed to look up channel name for %s: %s", channel_id, exc)
+            return channel_id
+        channel = resp.get("channel", {})
+        name = channel.get("name") or channel.get("name_normalized") or channel_id
+        self._channel_names[channel_id] = name
+        return name
 
-    def _resolve_owner(self, channel: dict) -> Optional[str]:
-        channel_id = channel.get("id")
-        channel_name = channel.get("name") or channel.get("name_normalized")
-        if channel_id in self.config.channel_owners:
-            return self.config.channel_owners[channel_id]
-        if channel_name and channel_name in self.config.channel_owners:
-            return self.config.channel_owners[channel_name]
-        return None
+    def _resolve_owner(self, channel_id: str) -> Optional[str]:
+        return self.config.resolved_owners.get(channel_id)
 
     def _debug_log_messages(self, channel_id: str, messages: List[dict]) -> None:
+        logger = logging.getLogger()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        trace = logger.isEnabledFor(TRACE)
         for msg in messages:
             user = msg.get("user") or msg.get("bot_id", "unknown")
             subtype = msg.get("subtype", "standard")
@@ -195,39 +587,64 @@ class SlackMonitor:
             text = (msg.get("text") or "").replace("\n", " ")
             snippet = text[:80] + ("..." if len(text) > 80 else "")
             logging.debug(
-                "Channel %s message ts=%s user=%s subtype=%s text=%s, msg=%s",
+                "Channel %s message ts=%s user=%s subtype=%s text=%s",
                 channel_id,
                 ts,
                 user,
                 subtype,
                 snippet,
-                msg
             )
+            if trace:
+                logging.log(TRACE, "Channel %s raw message %s", channel_id, msg)
 
-    def _evaluate_channel(self, messages: List[dict]) -> Optional[dict]:
-        if not messages:
-            return None
-        sorted_messages = sorted(messages, key=lambda m: float(m.get("ts", 0.0)))
+    def _evaluate_channel(self, messages: List[dict], previous: Optional[dict] = None) -> Optional[dict]:
+        # Slack returns history newest-first: the first client message is the latest
+        # one, and the first team message seen before it is the latest reply.
         last_client_msg = None
         last_team_reply = None
 
-        for msg in sorted_messages:
+        for msg in messages:
             if not self._is_valid_message(msg):
                 continue
             if self._is_client_message(msg):
                 last_client_msg = msg
-                last_team_reply = None
-            elif last_client_msg:
+                break
+            if last_team_reply is None:
                 last_team_reply = msg
 
-        if not last_client_msg:
+        # Merge with the previous record by timestamp: the fetched messages may be
+        # older than events already applied to it.
+        tz = self.config.business_hours.tz
+        if last_client_msg is not None:
+            client_ts = float(last_client_msg["ts"])
+        if last_client_msg is not None and (previous is None or client_ts >= previous["client_ts"]):
+            record = {
+                "client_ts": client_ts,
+                "client_text": last_client_msg.get("text", ""),
+                "client_dt": datetime.fromtimestamp(client_ts, tz=tz),
+                "team_reply_ts": None,
+                "team_reply_text": None,
+                "reply_dt": None,
+            }
+            if previous is not None and (previous["team_reply_ts"] or 0) > client_ts:
+                record.update(
+                    team_reply_ts=previous["team_reply_ts"],
+                    team_reply_text=previous["team_reply_text"],
+                    reply_dt=previous["reply_dt"],
+                )
+        elif previous is not None:
+            record = dict(previous)
+        else:
             return None
-        return {
-            "client_ts": float(last_client_msg["ts"]),
-            "client_text": last_client_msg.get("text", ""),
-            "team_reply_ts": float(last_team_reply["ts"]) if last_team_reply else None,
-            "team_reply_text": last_team_reply.get("text", "") if last_team_reply else None,
-        }
+        if last_team_reply is not None:
+            reply_ts = float(last_team_reply["ts"])
+            if reply_ts > record["client_ts"] and reply_ts > (record["team_reply_ts"] or 0):
+                record.update(
+                    team_reply_ts=reply_ts,
+                    team_reply_text=last_team_reply.get("text", ""),
+                    reply_dt=datetime.fromtimestamp(reply_ts, tz=tz),
+                )
+        return record
 
     def _is_valid_message(self, msg: dict) -> bool:
         if msg.get("subtype") in {"channel_join", "bot_message", "channel_topic", "channel_purpose"}:
@@ -241,12 +658,8 @@ class SlackMonitor:
         return user_id not in self.config.team_member_ids
 
     def _decide_status(self, record: dict, now: datetime) -> str:
-        client_dt = datetime.fromtimestamp(record["client_ts"], tz=ZoneInfo(self.config.business_hours.timezone))
-        reply_dt = (
-            datetime.fromtimestamp(record["team_reply_ts"], tz=ZoneInfo(self.config.business_hours.timezone))
-            if record.get("team_reply_ts")
-            else None
-        )
+        client_dt = record["client_dt"]
+        reply_dt = record["reply_dt"]
         if reply_dt and reply_dt > client_dt:
             return "answered"
 
@@ -261,56 +674,44 @@ class SlackMonitor:
         hours_since = round((now.timestamp() - record["client_ts"]) / 3600, 1)
         text = self.config.reminder_text_template.format(channel_id, hours_since)
         try:
-            dm_resp = self.client.conversations_open(users=owner_id)
-            dm_channel = dm_resp["channel"]["id"]
-            self.client.chat_postMessage(channel=dm_channel, text=text)
+            try:
+                self.client.chat_postMessage(channel=self._dm_channel(owner_id), text=text)
+            except SlackApiError as exc:
+                if exc.response.get("error") != "channel_not_found":
+                    raise
+                self._dm_channel_by_user.pop(owner_id, None)
+                self.client.chat_postMessage(channel=self._dm_channel(owner_id), text=text)
             logging.info("Reminder sent to %s for channel %s", owner_id, channel_id)
         except SlackApiError as exc:
             logging.exception("Failed to send reminder for %s: %s", channel_id, exc)
 
-    def _log_record(self, channel_name: str, channel_id: str, record: dict, status: str) -> None:
-        client_ts = datetime.fromtimestamp(record["client_ts"], tz=ZoneInfo(self.config.business_hours.timezone))
-        reply_ts = (
-            datetime.fromtimestamp(record["team_reply_ts"], tz=ZoneInfo(self.config.business_hours.timezone))
-            if record.get("team_reply_ts")
-            else None
-        )
-        hours_to_reply = (
-            (reply_ts - client_ts).total_seconds() / 3600 if reply_ts else None
-        )
-        line = (
-            f"{channel_name},{channel_id},{client_ts.isoformat()},"
-            f"{reply_ts.isoformat() if reply_ts else ''},{hours_to_reply or ''},{status}\n"
-        )
-        with self.config.log_path.open("a", encoding="utf-8") as fp:
-            fp.write(line)
-
-    def _log_trail(self, channel_name: str, channel_id: str, record: dict, status: str) -> None:
-        client_ts = datetime.fromtimestamp(record["client_ts"], tz=ZoneInfo(self.config.business_hours.timezone))
-        reply_ts = (
-            datetime.fromtimestamp(record["team_reply_ts"], tz=ZoneInfo(self.config.business_hours.timezone))
-            if record.get("team_reply_ts")
-            else None
-        )
-        hours_between = (
-            (reply_ts - client_ts).total_seconds() / 3600 if reply_ts else None
-        )
-        client_text = _csv_escape(record.get("client_text", ""))
-        reply_raw = record.get("team_reply_text") or ""
-        reply_text = _csv_escape(reply_raw) if reply_raw else ""
-        reply_ts_str = reply_ts.isoformat() if reply_ts else ""
-        line = (
-            f"{channel_name},{channel_id},{client_ts.isoformat()},{client_text},"
-            f"{reply_ts_str},{reply_text},{hours_between or ''},{status}\n"
+    def _dm_channel(self, owner_id: str) -> str:
+        dm_channel = self._dm_channel_by_user.get(owner_id)
+        if dm_channel is None:
+            dm_resp = self.client.conversations_open(users=owner_id)
+            dm_channel = dm_resp["channel"]["id"]
+            self._dm_channel_by_user[owner_id] = dm_channel
+        return dm_channel
+
+    def _log(self, channel_name: str, channel_id: str, record: dict, status: str) -> None:
+        client_dt = record["client_dt"]
+        reply_dt = record["reply_dt"]
+        client_iso = client_dt.isoformat()
+        reply_iso = reply_dt.isoformat() if reply_dt else ""
+        hours = ((reply_dt - client_dt).total_seconds() / 3600 if reply_dt else None) or ""
+        self._log_writer.writerow([channel_name, channel_id, client_iso, reply_iso, hours, status])
+        self._trail_writer.writerow(
+            [
+                channel_name,
+                channel_id,
+                client_iso,
+                (record.get("client_text") or "").translate(NEWLINES_TO_SPACES),
+                reply_iso,
+                (record.get("team_reply_text") or "").translate(NEWLINES_TO_SPACES),
+                hours,
+                status,
+            ]
         )
-        with self.config.trail_log_path.open("a", encoding="utf-8") as fp:
-            fp.write(line)
-
-
-def _csv_escape(text: str) -> str:
-    sanitized = (text or "").replace("\n", " ").replace("\r", " ")
-    sanitized = sanitized.replace("\"", "\"\"")
-    return f'"{sanitized}"'
 
 
 def load_config() -> MonitorConfig:
@@ -322,15 +723,33 @@ def load_config() -> MonitorConfig:
     return MonitorConfig.from_yaml(config_path)
 
 
-def build_client() -> WebClient:
+def build_client() -> RateLimitedClient:
     token = os.environ.get("SLACK_BOT_TOKEN")
     if not token:
         raise EnvironmentError("SLACK_BOT_TOKEN env var is required.")
-    return WebClient(token=token)
+    return RateLimitedClient(WebClient(token=token))
+
+
+def build_socket_client(monitor: SlackMonitor) -> SocketModeClient:
+    app_token = os.environ.get("SLACK_APP_TOKEN")
+    if not app_token:
+        raise EnvironmentError("SLACK_APP_TOKEN env var is required for --mode socket.")
+    socket_client = SocketModeClient(app_token=app_token)
+
+    def on_request(client: SocketModeClient, req: SocketModeRequest) -> None:
+        client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+        if req.type != "events_api":
+            return
+        event = req.payload.get("event", {})
+        if event.get("type") == "message":
+            monitor.handle_message_event(event)
+
+    socket_client.socket_mode_request_listeners.append(on_request)
+    return socket_client
 
 
-def configure_logging(debug: bool) -> None:
-    level = logging.DEBUG if debug else logging.INFO
+def configure_logging(debug: bool, trace: bool = False) -> None:
+    level = TRACE if trace else logging.DEBUG if debug else logging.INFO
     logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(message)s")
 
 
@@ -339,18 +758,47 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--debug",
         action="store_true",
-        help="Enable verbose debug logging (includes raw Slack message summaries)",
+        help="Enable verbose debug logging (one summary line per fetched Slack message)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Like --debug, but also dumps every raw Slack message payload",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("poll", "socket"),
+        default="poll",
+        help="poll: re-read channel history every interval; "
+        "socket: track messages via Socket Mode events (needs SLACK_APP_TOKEN)",
+    )
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="Monitor every channel the bot is a member of instead of only configured channels",
     )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    configure_logging(args.debug)
+    configure_logging(args.debug, args.trace)
     config = load_config()
     client = build_client()
-    monitor = SlackMonitor(config, client)
+    monitor = SlackMonitor(
+        config, client, discover=args.discover, event_driven=args.mode == "socket"
+    )
+    socket_client = build_socket_client(monitor) if args.mode == "socket" else None
+    monitor.resolve_channel_owners()
+    signal.signal(signal.SIGINT, lambda *_: monitor.stop())
+    signal.signal(signal.SIGTERM, lambda *_: monitor.stop())
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: monitor.trigger())
+    if socket_client is not None:
+        socket_client.connect()
     monitor.run_forever()
+    if socket_client is not None:
+        socket_client.close()
 
 
 if __name__ == "__main__":